@@ -5,6 +5,11 @@ from typing import Any, Dict, Mapping
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml not compiled in.
+    from yaml import SafeLoader as _YamlLoader
+
 from debate_arena.config.models import (
     AppConfig,
     ContextPolicyConfig,
@@ -15,12 +20,23 @@ from debate_arena.config.models import (
 )
 
 
+_CONFIG_CACHE: Dict[Path, tuple[float, AppConfig]] = {}
+
+
 def load_config(config_path: Path) -> AppConfig:
     if not config_path.exists():
         raise FileNotFoundError(f"Configuration file not found at: {config_path}")
 
-    with config_path.open("r", encoding="utf-8") as file_handle:
-        raw_data = yaml.safe_load(file_handle) or {}
+    # AppConfig is immutable, so repeated loads of an unchanged file can
+    # share one parsed instance; the mtime key drops the entry on edit.
+    resolved_path = config_path.resolve()
+    mtime = resolved_path.stat().st_mtime
+    cached = _CONFIG_CACHE.get(resolved_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+
+    with resolved_path.open("r", encoding="utf-8") as file_handle:
+        raw_data = yaml.load(file_handle, Loader=_YamlLoader) or {}
 
     if not isinstance(raw_data, Mapping):
         raise RuntimeError("Configuration root must be a mapping.")
@@ -35,12 +51,17 @@ def load_config(config_path: Path) -> AppConfig:
     runtime = RuntimeConfig(
         ollama_base_url=_string(runtime_raw, "ollama_base_url"),
         request_timeout_seconds=_float(runtime_raw, "request_timeout_seconds"),
+        prewarm_models=_optional_bool(runtime_raw, "prewarm_models", default=False),
     )
     debate = DebateConfig(
         language=_string(debate_raw, "language"),
         max_rounds=_positive_int(debate_raw, "max_rounds"),
         referee_interval=_positive_int(debate_raw, "referee_interval"),
         max_response_words=_positive_int(debate_raw, "max_response_words"),
+        review_window_turns=_non_negative_int(debate_raw, "review_window_turns", default=0),
+        repetition_abort_similarity=_optional_ratio(debate_raw, "repetition_abort_similarity", default=0.0),
+        review_skip_similarity=_optional_ratio(debate_raw, "review_skip_similarity", default=0.0),
+        review_min_transcript_tokens=_non_negative_int(debate_raw, "review_min_transcript_tokens", default=0),
     )
     prompts = PromptRepositoryConfig(
         directory=prompt_directory,
@@ -77,14 +98,16 @@ def load_config(config_path: Path) -> AppConfig:
         if not (prompt_directory / "compactor.j2").exists():
             raise RuntimeError("Missing compactor.j2 prompt template required for the default compactor.")
 
-    return AppConfig(
+    config = AppConfig(
         runtime=runtime,
         debate=debate,
         prompts=prompts,
         context_policy=context_policy,
         models=models,
-        config_path=config_path.resolve(),
+        config_path=resolved_path,
     )
+    _CONFIG_CACHE[resolved_path] = (mtime, config)
+    return config
 
 
 def _load_model(role: str, model_raw: Any) -> ModelRoleConfig:
@@ -96,6 +119,7 @@ def _load_model(role: str, model_raw: Any) -> ModelRoleConfig:
         temperature=_float(model_raw, "temperature"),
         keep_alive=_string(model_raw, "keep_alive"),
         prompt_file=_string(model_raw, "prompt_file"),
+        system_prompt_file=_optional_string(model_raw, "system_prompt_file"),
     )
 
 
@@ -110,6 +134,10 @@ def _validate_models(models: Dict[str, ModelRoleConfig], prompt_directory: Path)
             raise RuntimeError(
                 f"Prompt file '{model_config.prompt_file}' for role '{role}' does not exist in {prompt_directory}."
             )
+        if model_config.system_prompt_file and not (prompt_directory / model_config.system_prompt_file).exists():
+            raise RuntimeError(
+                f"System prompt file '{model_config.system_prompt_file}' for role '{role}' does not exist in {prompt_directory}."
+            )
 
 
 def _mapping(raw_data: Mapping[str, Any], key: str) -> Mapping[str, Any]:
@@ -119,6 +147,15 @@ def _mapping(raw_data: Mapping[str, Any], key: str) -> Mapping[str, Any]:
     return value
 
 
+def _optional_string(raw_data: Mapping[str, Any], key: str, default: str = "") -> str:
+    value = raw_data.get(key)
+    if value is None:
+        return default
+    if not isinstance(value, str) or not value.strip():
+        raise RuntimeError(f"Configuration value '{key}' must be a non-empty string when provided.")
+    return value.strip()
+
+
 def _string(raw_data: Mapping[str, Any], key: str) -> str:
     value = raw_data.get(key)
     if not isinstance(value, str) or not value.strip():
@@ -140,6 +177,20 @@ def _positive_int(raw_data: Mapping[str, Any], key: str) -> int:
     return value
 
 
+def _optional_bool(raw_data: Mapping[str, Any], key: str, default: bool) -> bool:
+    value = raw_data.get(key, default)
+    if not isinstance(value, bool):
+        raise RuntimeError(f"Configuration value '{key}' must be a boolean.")
+    return value
+
+
+def _non_negative_int(raw_data: Mapping[str, Any], key: str, default: int) -> int:
+    value = raw_data.get(key, default)
+    if not isinstance(value, int) or value < 0:
+        raise RuntimeError(f"Configuration value '{key}' must be a non-negative integer.")
+    return value
+
+
 def _ratio(raw_data: Mapping[str, Any], key: str) -> float:
     value = _float(raw_data, key)
     if value <= 0 or value >= 1:
@@ -147,6 +198,13 @@ def _ratio(raw_data: Mapping[str, Any], key: str) -> float:
     return value
 
 
+def _optional_ratio(raw_data: Mapping[str, Any], key: str, default: float) -> float:
+    value = raw_data.get(key, default)
+    if not isinstance(value, (int, float)) or value < 0 or value >= 1:
+        raise RuntimeError(f"Configuration value '{key}' must be 0 (disabled) or between 0 and 1.")
+    return float(value)
+
+
 def _resolve_path(base_directory: Path, value: str) -> Path:
     candidate = Path(value)
     if not candidate.is_absolute():
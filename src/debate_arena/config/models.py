@@ -5,36 +5,42 @@ from pathlib import Path
 from typing import Dict
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RuntimeConfig:
     ollama_base_url: str
     request_timeout_seconds: float
+    prewarm_models: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DebateConfig:
     language: str
     max_rounds: int
     referee_interval: int
     max_response_words: int
+    review_window_turns: int = 0
+    repetition_abort_similarity: float = 0.0
+    review_skip_similarity: float = 0.0
+    review_min_transcript_tokens: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class PromptRepositoryConfig:
     directory: Path
     opening_prompt_file: str
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ModelRoleConfig:
     role: str
     name: str
     temperature: float
     keep_alive: str
     prompt_file: str
+    system_prompt_file: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ContextPolicyConfig:
     context_window: int
     usage_threshold_ratio: float
@@ -43,7 +49,7 @@ class ContextPolicyConfig:
     compact_summary_max_chars: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     runtime: RuntimeConfig
     debate: DebateConfig
@@ -4,14 +4,14 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class UsageSnapshot:
     prompt_tokens: int = 0
     completion_tokens: int = 0
     total_duration_ns: int = 0
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TranscriptEntry:
     role: str
     speaker: str
@@ -19,7 +19,7 @@ class TranscriptEntry:
     round_number: int
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RoleGuidance:
     claims_refuted: List[str] = field(default_factory=list)
     claims_unanswered: List[str] = field(default_factory=list)
@@ -28,7 +28,7 @@ class RoleGuidance:
     required_next_move: str = ""
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RefereeReview:
     decision: str
     reason: str
@@ -76,7 +76,7 @@ class RefereeReview:
         return values
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Verdict:
     winner: str
     reason: str
@@ -98,7 +98,7 @@ class DebateObserver(Protocol):
     def on_final_verdict_start(self) -> None: ...
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DebateResult:
     topic: str
     winner: str
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import asdict
-from typing import Any, Dict, List, Mapping, Optional, TypedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List, Mapping, Optional, Sequence, TypedDict
 
 from langgraph.graph import END, START, StateGraph
 
@@ -17,6 +18,7 @@ from debate_arena.services.formatting import (
     unique_lines,
 )
 from debate_arena.services.parsing import extract_json_object
+from debate_arena.services.similarity import RepetitionGuard, ngram_jaccard
 
 
 DEBATER_ROLES = ("debater_a", "debater_b")
@@ -39,6 +41,7 @@ class DebateState(TypedDict, total=False):
     usage_by_role: Dict[str, Dict[str, int]]
     prepared_role: str
     prepared_prompt: str
+    prepared_system: str
     should_compact: bool
     needs_final_verdict: bool
     termination_reason: str
@@ -52,6 +55,16 @@ class DebateState(TypedDict, total=False):
 
 
 class DebateWorkflow:
+    __slots__ = (
+        "_config",
+        "_prompt_repository",
+        "_model_factory",
+        "_observer",
+        "_context_budget",
+        "_static_context",
+        "_graph",
+    )
+
     def __init__(
         self,
         config: AppConfig,
@@ -64,6 +77,7 @@ class DebateWorkflow:
         self._model_factory = model_factory
         self._observer = observer
         self._context_budget = ContextBudgetService(config.context_policy)
+        self._static_context: Dict[tuple, Dict[str, Any]] = {}
         self._graph = self._build_graph()
 
     def run(self, topic: str) -> DebateResult:
@@ -73,6 +87,21 @@ class DebateWorkflow:
         final_state = self._graph.invoke(initial_state)
         return self._build_result(final_state)
 
+    def run_many(self, topics: Sequence[str], max_workers: int = 2) -> List[DebateResult]:
+        """Run several independent debates concurrently.
+
+        Debates share the compiled graph and the factory's model clients, so
+        overlapping runs let the serving backend batch requests from
+        different topics while each debate stays serial internally. Results
+        come back in topic order. A console observer would interleave
+        events from concurrent debates; construct the workflow without one
+        for batch runs.
+        """
+        if len(topics) <= 1 or max_workers <= 1:
+            return [self.run(topic) for topic in topics]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.run, topics))
+
     def _build_graph(self):
         graph = StateGraph(DebateState)
         graph.add_node("prepare_turn", self._prepare_turn)
@@ -116,6 +145,7 @@ class DebateWorkflow:
             usage_by_role={},
             prepared_role="",
             prepared_prompt="",
+            prepared_system="",
             should_compact=False,
             needs_final_verdict=False,
             termination_reason="",
@@ -134,14 +164,17 @@ class DebateWorkflow:
         enriched_state = dict(state)
         enriched_state["debate_phase"] = debate_phase
         prompt = self._render_debater_prompt(role, enriched_state)
+        system_prompt = self._render_debater_system_prompt(role, enriched_state)
+        prompt = self._enforce_prompt_budget(role, enriched_state, prompt, system_prompt)
         usage = self._usage_snapshot(state, role)
         should_compact = self._context_budget.should_compact(
-            prompt_text=prompt,
+            prompt_text=system_prompt + prompt,
             usage_snapshot=usage,
         )
         return DebateState(
             prepared_role=role,
             prepared_prompt=prompt,
+            prepared_system=system_prompt,
             should_compact=should_compact,
             debate_phase=debate_phase,
         )
@@ -154,8 +187,14 @@ class DebateWorkflow:
 
         older_messages = transcript[:-keep_count]
         retained_messages = transcript[-keep_count:]
+        compactor_template = self._config.model_for("compactor").prompt_file
+        compactor_system = self._render_system_companion(
+            compactor_template,
+            state,
+            target_chars=self._config.context_policy.compact_summary_max_chars,
+        )
         compactor_prompt = self._prompt_repository.render(
-            self._config.model_for("compactor").prompt_file,
+            compactor_template,
             topic=state["topic"],
             language=state["language"],
             previous_summary=state["compact_summary"] or "[No prior summary]",
@@ -163,8 +202,8 @@ class DebateWorkflow:
             restrictions_text=self._render_all_restrictions_text(state),
             target_chars=self._config.context_policy.compact_summary_max_chars,
         )
-        compactor_result = self._model_factory.get("compactor").invoke(compactor_prompt)
-        self._context_budget.calibrate(len(compactor_prompt), compactor_result.prompt_tokens)
+        compactor_result = self._model_factory.get("compactor").invoke(compactor_prompt, system=compactor_system)
+        self._context_budget.calibrate(len(compactor_system) + len(compactor_prompt), compactor_result.prompt_tokens)
         updated_usage = self._record_usage(state, "compactor", compactor_result)
         rebuilt_state = dict(state)
         rebuilt_state["compact_summary"] = compactor_result.content.strip()
@@ -186,17 +225,32 @@ class DebateWorkflow:
     def _speak_turn(self, state: DebateState) -> DebateState:
         role = state["prepared_role"]
         prompt = state["prepared_prompt"]
+        system_prompt = state.get("prepared_system", "")
         usage_state: DebateState = DebateState(usage_by_role=state.get("usage_by_role", {}))
         content = ""
         last_validation: Optional[RefereeReview] = None
         current_prompt = prompt
+        # The transcript does not change between attempts, so the review
+        # window is rendered once and shared by every validation call.
+        window_text = render_transcript(self._review_window(state))
 
         for _ in range(MAX_TURN_ATTEMPTS):
-            result = self._model_factory.get(role).invoke(current_prompt)
-            self._context_budget.calibrate(len(current_prompt), result.prompt_tokens)
+            repetition_guard = self._build_repetition_guard(state, role)
+            result = self._model_factory.get(role).invoke_streaming(
+                current_prompt,
+                system=system_prompt,
+                should_abort=repetition_guard,
+            )
+            self._context_budget.calibrate(len(system_prompt) + len(current_prompt), result.prompt_tokens)
             usage_state = DebateState(usage_by_role=self._record_usage(usage_state, role, result))
+            if repetition_guard is not None and repetition_guard.tripped:
+                # Generation was cancelled mid-stream: skip the referee call
+                # and go straight to a rewrite, the candidate is a known dupe.
+                last_validation = _repetition_abort_review(role)
+                current_prompt = self._build_retry_prompt(prompt, role, last_validation)
+                continue
             candidate = result.content.strip()
-            validation, validation_result = self._validate_turn(state, role, candidate)
+            validation, validation_result = self._validate_turn(state, role, candidate, transcript_text=window_text)
             usage_state = DebateState(usage_by_role=self._record_usage(usage_state, "referee", validation_result))
             if validation.decision == "continue":
                 content = candidate
@@ -211,7 +265,7 @@ class DebateWorkflow:
             return DebateState(
                 usage_by_role=usage_state["usage_by_role"],
                 guidance_by_role=updated_guidance,
-                restrictions=self._flatten_restrictions_by_role(updated_guidance),
+                restrictions=self._flattened_restrictions(state, updated_guidance),
                 needs_final_verdict=True,
                 termination_reason=self._build_invalid_turn_termination(role, last_validation),
                 winner=opponent,
@@ -247,17 +301,24 @@ class DebateWorkflow:
                 )
             return DebateState(needs_final_verdict=False, termination_reason="")
 
+        if self._should_skip_review(state, completed_rounds):
+            if self._observer:
+                self._observer.on_review(completed_rounds, "continue", "Review skipped: both debaters produced clearly new material.")
+            return DebateState(needs_final_verdict=False, termination_reason="")
+
+        review_template = self._config.model_for("referee").prompt_file
+        review_system = self._render_system_companion(review_template, state)
         review_prompt = self._prompt_repository.render(
-            self._config.model_for("referee").prompt_file,
+            review_template,
             topic=state["topic"],
             language=state["language"],
             completed_rounds=completed_rounds,
             compact_summary=state["compact_summary"] or "[No summary yet]",
-            transcript_text=render_transcript(state["transcript"]),
+            transcript_text=render_transcript(self._review_window(state)),
             restrictions_text=self._render_all_restrictions_text(state),
         )
-        review_result = self._model_factory.get("referee").invoke(review_prompt)
-        self._context_budget.calibrate(len(review_prompt), review_result.prompt_tokens)
+        review_result = self._model_factory.get("referee").invoke(review_prompt, system=review_system)
+        self._context_budget.calibrate(len(review_system) + len(review_prompt), review_result.prompt_tokens)
         review = self._parse_review(review_result.content)
         if self._observer:
             self._observer.on_review(completed_rounds, review.decision, review.reason)
@@ -270,7 +331,7 @@ class DebateWorkflow:
         return DebateState(
             usage_by_role=updated_usage,
             guidance_by_role=updated_guidance,
-            restrictions=self._flatten_restrictions_by_role(updated_guidance),
+            restrictions=self._flattened_restrictions(state, updated_guidance),
             needs_final_verdict=needs_final_verdict,
             termination_reason=termination_reason,
             winner=review.winner,
@@ -278,11 +339,47 @@ class DebateWorkflow:
             strongest_point_b=review.strongest_point_b,
         )
 
+    def _should_skip_review(self, state: Mapping[str, Any], completed_rounds: int) -> bool:
+        """Cheap pre-check that lets uneventful review rounds skip the referee.
+
+        When both debaters' latest turns share few word trigrams with their
+        own previous turn, the round is clearly progressing: there is no
+        loop or stalemate for the referee to act on, so the review LLM call
+        is skipped and the debate continues with the existing guidance.
+        Disabled when review_skip_similarity is 0, when either debater has
+        fewer than two turns, or once the round cap is reached. A window
+        whose estimated size is under review_min_transcript_tokens is also
+        skipped: there is too little material for a meaningful review.
+        """
+        if completed_rounds >= state["max_rounds"]:
+            return False
+        min_tokens = self._config.debate.review_min_transcript_tokens
+        if min_tokens > 0:
+            window_tokens = sum(
+                self._context_budget.estimate_tokens(str(entry["content"]))
+                for entry in self._review_window(state)
+            )
+            if window_tokens < min_tokens:
+                return True
+        threshold = self._config.debate.review_skip_similarity
+        if threshold <= 0:
+            return False
+        transcript = state["transcript"]
+        for role in DEBATER_ROLES:
+            turns = [entry["content"] for entry in transcript if entry["role"] == role]
+            if len(turns) < 2:
+                return False
+            if ngram_jaccard(turns[-1], turns[-2]) >= threshold:
+                return False
+        return True
+
     def _final_verdict(self, state: DebateState) -> DebateState:
         if self._observer:
             self._observer.on_final_verdict_start()
+        verdict_template = self._config.model_for("referee").prompt_file.replace("review", "final")
+        verdict_system = self._render_system_companion(verdict_template, state)
         verdict_prompt = self._prompt_repository.render(
-            self._config.model_for("referee").prompt_file.replace("review", "final"),
+            verdict_template,
             topic=state["topic"],
             language=state["language"],
             completed_rounds=state["round_number"] - 1,
@@ -292,8 +389,8 @@ class DebateWorkflow:
             termination_reason=state["termination_reason"] or "Arbiter must issue final verdict.",
             provisional_winner=state.get("winner") or "draw",
         )
-        verdict_result = self._model_factory.get("referee").invoke(verdict_prompt)
-        self._context_budget.calibrate(len(verdict_prompt), verdict_result.prompt_tokens)
+        verdict_result = self._model_factory.get("referee").invoke(verdict_prompt, system=verdict_system)
+        self._context_budget.calibrate(len(verdict_system) + len(verdict_prompt), verdict_result.prompt_tokens)
         verdict = self._parse_verdict(verdict_result.content)
         updated_usage = self._record_usage(state, "referee", verdict_result)
         return DebateState(
@@ -318,8 +415,28 @@ class DebateWorkflow:
     def _route_after_review(state: DebateState) -> str:
         return "final_verdict" if state.get("needs_final_verdict") else "prepare_turn"
 
+    def _debater_static_context(self, role: str, state: Mapping[str, Any]) -> Dict[str, Any]:
+        """Template values that stay constant for a role across a debate.
+
+        Built once per (role, topic) and spliced into every render, so the
+        per-turn calls only assemble the volatile values.
+        """
+        key = (role, state["topic"])
+        cached = self._static_context.get(key)
+        if cached is None:
+            cached = {
+                "topic": state["topic"],
+                "language": state["language"],
+                "speaker_name": speaker_name_for_role(role),
+                "stance": "in favor" if role == "debater_a" else "against",
+                "max_response_words": self._config.debate.max_response_words,
+                "max_rounds": state["max_rounds"],
+            }
+            self._static_context[key] = cached
+        return cached
+
     def _render_debater_prompt(self, role: str, state: Mapping[str, Any]) -> str:
-        stance = "in favor" if role == "debater_a" else "against"
+        static_context = self._debater_static_context(role, state)
         guidance = _guidance_for_role(state.get("guidance_by_role"), role)
         strongest_opponent_point = state.get("strongest_point_b", "") if role == "debater_a" else state.get("strongest_point_a", "")
         strongest_own_point = state.get("strongest_point_a", "") if role == "debater_a" else state.get("strongest_point_b", "")
@@ -327,19 +444,12 @@ class DebateWorkflow:
         if not state.get("transcript"):
             opening_prompt = self._prompt_repository.render(
                 self._config.prompts.opening_prompt_file,
-                topic=state["topic"],
-                language=state["language"],
-                speaker_name=speaker_name_for_role(role),
-                stance=stance,
+                **static_context,
             )
         return self._prompt_repository.render(
             self._config.model_for(role).prompt_file,
-            topic=state["topic"],
-            language=state["language"],
-            speaker_name=speaker_name_for_role(role),
-            stance=stance,
+            **static_context,
             debate_phase=state.get("debate_phase", "exchange"),
-            max_response_words=self._config.debate.max_response_words,
             opening_prompt=opening_prompt,
             compact_summary=state.get("compact_summary") or "[No summary yet]",
             transcript_text=render_transcript(state.get("transcript", [])),
@@ -350,7 +460,49 @@ class DebateWorkflow:
             claims_unanswered_text=render_restrictions(guidance.claims_unanswered),
             required_next_move=guidance.required_next_move or "Respond to the rival's best point and advance a new angle.",
             round_number=state["round_number"],
-            max_rounds=state["max_rounds"],
+        )
+
+    def _enforce_prompt_budget(
+        self,
+        role: str,
+        state: Mapping[str, Any],
+        prompt: str,
+        system_prompt: str,
+    ) -> str:
+        """Hard sliding-window guard over the rendered debater prompt.
+
+        Compaction is preventive and may lag behind a burst of long turns;
+        this deterministic fallback evicts the oldest transcript turns in
+        whole A/B pairs (never orphaning one side's reply) until the prompt
+        fits within the configured context window minus the response buffer.
+        """
+        budget = self._context_budget
+        if budget.fits_prompt_budget(system_prompt + prompt):
+            return prompt
+        transcript = list(state.get("transcript", []))
+        trimmed_state = dict(state)
+        while len(transcript) > 2 and not budget.fits_prompt_budget(system_prompt + prompt):
+            # Drop whole pairs worth at least the token excess before paying
+            # for a re-render, using per-entry estimates instead of
+            # re-measuring the full prompt for every evicted pair.
+            excess = budget.estimate_tokens(system_prompt + prompt) - budget.prompt_budget_tokens
+            dropped_tokens = 0
+            while len(transcript) > 2 and dropped_tokens < excess:
+                evicted, transcript = transcript[:2], transcript[2:]
+                dropped_tokens += sum(budget.estimate_tokens(entry["content"]) for entry in evicted)
+            trimmed_state["transcript"] = transcript
+            prompt = self._render_debater_prompt(role, trimmed_state)
+        return prompt
+
+    def _render_debater_system_prompt(self, role: str, state: Mapping[str, Any]) -> str:
+        system_prompt_file = self._config.model_for(role).system_prompt_file
+        if not system_prompt_file:
+            return ""
+        # Only debate-constant values may appear here: the rendered text must be
+        # identical on every turn so the backend prompt-prefix cache stays warm.
+        return self._prompt_repository.render(
+            system_prompt_file,
+            **self._debater_static_context(role, state),
         )
 
     def _validate_turn(
@@ -358,9 +510,13 @@ class DebateWorkflow:
         state: Mapping[str, Any],
         role: str,
         candidate_turn: str,
+        transcript_text: Optional[str] = None,
     ) -> tuple[RefereeReview, LLMCallResult]:
         stance = "in favor" if role == "debater_a" else "against"
         opponent = "debater_b" if role == "debater_a" else "debater_a"
+        validation_system = self._render_system_companion("turn_guard.j2", state)
+        if transcript_text is None:
+            transcript_text = render_transcript(self._review_window(state))
         validation_prompt = self._prompt_repository.render(
             "turn_guard.j2",
             topic=state["topic"],
@@ -370,16 +526,57 @@ class DebateWorkflow:
             rival_name=speaker_name_for_role(opponent),
             stance=stance,
             compact_summary=state.get("compact_summary") or "[No summary yet]",
-            transcript_text=render_transcript(state.get("transcript", [])),
+            transcript_text=transcript_text,
             restrictions_text=render_restrictions(
                 self._active_restrictions_for_role(_guidance_for_role(state.get("guidance_by_role"), role))
             ),
             candidate_turn=candidate_turn or "[Empty turn]",
         )
-        validation_result = self._model_factory.get("referee").invoke(validation_prompt)
-        self._context_budget.calibrate(len(validation_prompt), validation_result.prompt_tokens)
+        validation_result = self._model_factory.get("referee").invoke(validation_prompt, system=validation_system)
+        self._context_budget.calibrate(len(validation_system) + len(validation_prompt), validation_result.prompt_tokens)
         return self._parse_review(validation_result.content), validation_result
 
+    def _build_repetition_guard(self, state: Mapping[str, Any], role: str) -> Optional[RepetitionGuard]:
+        threshold = self._config.debate.repetition_abort_similarity
+        if threshold <= 0:
+            return None
+        for entry in reversed(state.get("transcript", [])):
+            if entry["role"] == role:
+                return RepetitionGuard(str(entry["content"]), threshold=threshold)
+        return None
+
+    def _render_system_companion(self, template_file: str, state: Mapping[str, Any], **extra: Any) -> str:
+        """Render the static system companion of a prompt template.
+
+        Companion templates follow the <name>_system.j2 convention and hold
+        the instruction blocks that only depend on debate-constant values;
+        keeping them in a stable SystemMessage lets the serving backend
+        reuse the cached prefix between consecutive calls of the same kind.
+        """
+        system_file = template_file.replace(".j2", "_system.j2")
+        if not self._prompt_repository.exists(system_file):
+            return ""
+        return self._prompt_repository.render(
+            system_file,
+            topic=state["topic"],
+            language=state["language"],
+            **extra,
+        )
+
+    def _review_window(self, state: Mapping[str, Any]) -> List[Dict[str, Any]]:
+        """Recent transcript slice for referee calls.
+
+        Older turns are represented by the compact summary and the cumulative
+        restriction state, so periodic reviews and turn-guard checks only need
+        the recent delta; this keeps referee prompt size bounded as the debate
+        grows. The final verdict still sees the full retained transcript.
+        """
+        transcript = state.get("transcript", [])
+        window = self._config.debate.review_window_turns
+        if window > 0 and len(transcript) > window:
+            return transcript[-window:]
+        return transcript
+
     def _build_retry_prompt(self, base_prompt: str, role: str, validation: RefereeReview) -> str:
         guidance = validation.guidance_for(role)
         issues = self._active_restrictions_for_role(guidance) or [validation.reason or "You broke role coherence."]
@@ -412,7 +609,7 @@ class DebateWorkflow:
         for role in DEBATER_ROLES:
             previous = _guidance_for_role(current_guidance, role)
             latest = review.guidance_for(role)
-            merged[role] = RoleGuidance(
+            candidate = RoleGuidance(
                 claims_refuted=latest.claims_refuted,
                 claims_unanswered=latest.claims_unanswered,
                 actionable_restrictions=_merge_active_lines(
@@ -427,10 +624,26 @@ class DebateWorkflow:
                 ),
                 required_next_move=latest.required_next_move,
             )
+            # Reusing the previous object when the merge changed nothing
+            # lets callers detect no-op reviews with a cheap comparison.
+            merged[role] = previous if candidate == previous else candidate
         return merged
 
+    def _flattened_restrictions(self, state: Mapping[str, Any], updated_guidance: Mapping[str, RoleGuidance]) -> List[str]:
+        """Flattened restriction lines, reusing state when guidance is unchanged."""
+        if updated_guidance == state.get("guidance_by_role"):
+            existing = state.get("restrictions")
+            if existing is not None:
+                return existing
+        return self._flatten_restrictions_by_role(updated_guidance)
+
     def _render_all_restrictions_text(self, state: Mapping[str, Any]) -> str:
-        return render_restrictions(self._flatten_restrictions_by_role(state.get("guidance_by_role")))
+        # The flattened list is maintained in state at every guidance merge,
+        # so prompts reuse it instead of re-flattening the guidance per call.
+        restrictions = state.get("restrictions")
+        if restrictions is None:
+            restrictions = self._flatten_restrictions_by_role(state.get("guidance_by_role"))
+        return render_restrictions(restrictions)
 
     def _flatten_restrictions_by_role(self, guidance_by_role: Optional[Mapping[str, RoleGuidance]]) -> List[str]:
         lines: List[str] = []
@@ -574,6 +787,21 @@ class DebateWorkflow:
         return "exchange"
 
 
+def _repetition_abort_review(role: str) -> RefereeReview:
+    return RefereeReview(
+        decision="end",
+        reason="Generation aborted: the turn was converging on the speaker's previous intervention.",
+        guidance_by_role={
+            role: RoleGuidance(
+                actionable_restrictions=[
+                    "Do not restate your previous intervention; every turn must add new content.",
+                ],
+                required_next_move="Rewrite the turn with a genuinely new argumentative line instead of repeating yourself.",
+            )
+        },
+    )
+
+
 def _coerce_bool(value: Any) -> bool:
     if isinstance(value, bool):
         return value
@@ -1,10 +1,10 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Callable, Optional, Protocol
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LLMCallResult:
     content: str
     prompt_tokens: int = 0
@@ -13,7 +13,15 @@ class LLMCallResult:
 
 
 class RoleModel(Protocol):
-    def invoke(self, prompt: str) -> LLMCallResult:
+    def invoke(self, prompt: str, system: str = "") -> LLMCallResult:
+        ...
+
+    def invoke_streaming(
+        self,
+        prompt: str,
+        system: str = "",
+        should_abort: Optional[Callable[[str], bool]] = None,
+    ) -> LLMCallResult:
         ...
 
 
@@ -1,31 +1,93 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Dict, Mapping, Optional
 
-from langchain_core.messages import HumanMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
 from langchain_ollama import ChatOllama
 
-from debate_arena.config.models import AppConfig, ModelRoleConfig
+from debate_arena.config.models import AppConfig, ModelRoleConfig, RuntimeConfig
 from debate_arena.llm.interfaces import LLMCallResult, ModelFactory, RoleModel
 
 
 class OllamaRoleModel(RoleModel):
-    def __init__(self, runtime_base_url: str, model_config: ModelRoleConfig, context_window: int):
+    def __init__(self, runtime: RuntimeConfig, model_config: ModelRoleConfig, context_window: int):
         self._role = model_config.role
+        self._context_window = context_window
+        self._system_messages: Dict[str, SystemMessage] = {}
         self._model = ChatOllama(
             model=model_config.name,
-            base_url=runtime_base_url,
+            base_url=runtime.ollama_base_url,
             temperature=model_config.temperature,
             num_ctx=context_window,
             keep_alive=model_config.keep_alive,
             reasoning=False,
             format=_format_for_role(model_config.role),
+            # Applied to the underlying persistent httpx client, which also
+            # keeps its connections alive across calls.
+            client_kwargs={"timeout": runtime.request_timeout_seconds},
         )
 
-    def invoke(self, prompt: str) -> LLMCallResult:
-        response = self._model.invoke([HumanMessage(content=prompt)])
+    def invoke(self, prompt: str, system: str = "") -> LLMCallResult:
+        response = self._model.invoke(self._build_messages(prompt, system))
         metadata = getattr(response, "response_metadata", {}) or {}
         content = response.content if isinstance(response.content, str) else str(response.content)
+        return self._build_result(content, metadata)
+
+    def invoke_streaming(
+        self,
+        prompt: str,
+        system: str = "",
+        should_abort: Optional[Callable[[str], bool]] = None,
+    ) -> LLMCallResult:
+        """Accumulate a streamed generation instead of blocking on invoke.
+
+        Behaves like invoke, but the caller can cancel decoding mid-stream via
+        should_abort, which receives the text accumulated so far. Aborting
+        stops the generation request and returns the partial content.
+        """
+        parts: list[str] = []
+        metadata: Dict[str, Any] = {}
+        for chunk in self._model.stream(self._build_messages(prompt, system)):
+            if isinstance(chunk.content, str) and chunk.content:
+                parts.append(chunk.content)
+            chunk_metadata = getattr(chunk, "response_metadata", {}) or {}
+            if chunk_metadata:
+                metadata.update(chunk_metadata)
+            if should_abort is not None and parts and should_abort("".join(parts)):
+                break
+        return self._build_result("".join(parts), metadata)
+
+    def warm(self) -> None:
+        """Issue a minimal generation so the server loads the model eagerly.
+
+        Best effort: if the server is unreachable the first real call will
+        surface the error with full context, so failures are ignored here.
+        """
+        try:
+            self._model.invoke(
+                [HumanMessage(content="ok")],
+                options={"num_ctx": self._context_window, "num_predict": 1},
+            )
+        except Exception:  # noqa: BLE001 - warm-up must never break a run.
+            pass
+
+    def _build_messages(self, prompt: str, system: str) -> list[BaseMessage]:
+        messages: list[BaseMessage] = []
+        if system:
+            # The system message must stay byte-identical across turns so the
+            # Ollama server can reuse its prompt-prefix KV cache. System
+            # prompts repeat verbatim every call, so the (immutable) message
+            # object is built once per distinct content and reused.
+            cached = self._system_messages.get(system)
+            if cached is None:
+                cached = SystemMessage(content=system)
+                self._system_messages[system] = cached
+            messages.append(cached)
+        messages.append(HumanMessage(content=prompt))
+        return messages
+
+    @staticmethod
+    def _build_result(content: str, metadata: Mapping[str, Any]) -> LLMCallResult:
         return LLMCallResult(
             content=content,
             prompt_tokens=int(metadata.get("prompt_eval_count", 0)),
@@ -38,14 +100,38 @@ class OllamaChatFactory(ModelFactory):
     def __init__(self, config: AppConfig):
         self._config = config
         self._cache: Dict[str, RoleModel] = {}
+        self._shared_models: Dict[tuple, RoleModel] = {}
 
     def get(self, role: str) -> RoleModel:
         if role not in self._cache:
             model_config = self._config.model_for(role)
             context_window = self._config.context_policy.context_window
-            self._cache[role] = OllamaRoleModel(self._config.runtime.ollama_base_url, model_config, context_window)
+            # Roles with identical generation settings (typically both
+            # debaters) share one ChatOllama instance and therefore one warm
+            # HTTP connection pool to the Ollama server.
+            shared_key = (
+                model_config.name,
+                model_config.temperature,
+                model_config.keep_alive,
+                _format_for_role(role) is not None,
+            )
+            if shared_key not in self._shared_models:
+                self._shared_models[shared_key] = OllamaRoleModel(
+                    self._config.runtime,
+                    model_config,
+                    context_window,
+                )
+            self._cache[role] = self._shared_models[shared_key]
         return self._cache[role]
 
+    def warm_up(self) -> None:
+        warmed_ids: set[int] = set()
+        for role in self._config.models:
+            model = self.get(role)
+            if id(model) not in warmed_ids:
+                warmed_ids.add(id(model))
+                model.warm()  # type: ignore[attr-defined]
+
 
 def _format_for_role(role: str) -> Optional[dict[str, Any] | str]:
     if role != "referee":
@@ -5,29 +5,22 @@ import sys
 from pathlib import Path
 from typing import Optional
 
-from debate_arena.config.loader import load_config
-from debate_arena.graph.workflow import DebateWorkflow
-from debate_arena.llm.ollama import OllamaChatFactory
-from debate_arena.prompts.repository import PromptRepository
-from debate_arena.services.presenter import ConsoleDebateObserver, ConsolePresenter
-
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Autonomous CLI debate system")
     parser.add_argument("-p", "--prompt", help="Tema o tesis del debate")
     parser.add_argument("--config", default="config/settings.yaml", help="Ruta al fichero de configuración")
     parser.add_argument("-f", "--file", help="Ruta opcional para guardar la transcripción final")
+    parser.add_argument("--topics-file", help="Fichero con un tema por línea para ejecutar varios debates")
+    parser.add_argument("--workers", type=int, default=2, help="Número de debates concurrentes en modo batch")
     return parser
 
 
 def resolve_config_path(config_argument: str) -> Path:
-    config_path = Path(config_argument)
-    if config_path.exists():
-        return config_path
     package_root = Path(__file__).resolve().parents[2]
-    candidate = package_root / config_argument
-    if candidate.exists():
-        return candidate
+    for candidate in (Path(config_argument), package_root / config_argument):
+        if candidate.is_file():
+            return candidate
     raise FileNotFoundError(f"Configuration file not found at: {config_argument}")
 
 
@@ -35,20 +28,72 @@ def main(argv: Optional[list[str]] = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    # Deferred so --help and argument errors do not pay the import cost of
+    # the langchain/langgraph/rich/yaml stack.
+    from debate_arena.config.loader import load_config
+    from debate_arena.graph.workflow import DebateWorkflow
+    from debate_arena.llm.ollama import OllamaChatFactory
+    from debate_arena.prompts.repository import PromptRepository
+    from debate_arena.services.presenter import (
+        CompositeObserver,
+        ConsoleDebateObserver,
+        ConsolePresenter,
+        TranscriptFileObserver,
+    )
+
     try:
         config = load_config(resolve_config_path(args.config))
+        output_file = Path(args.file) if args.file else None
+        model_factory = OllamaChatFactory(config)
+        if config.runtime.prewarm_models:
+            model_factory.warm_up()
+
+        if args.topics_file:
+            topics = [
+                line.strip()
+                for line in Path(args.topics_file).read_text(encoding="utf-8").splitlines()
+                if line.strip()
+            ]
+            if not topics:
+                raise RuntimeError(f"No topics found in: {args.topics_file}")
+            # Batch debates run without a console observer: interleaved
+            # events from concurrent debates would be unreadable.
+            workflow = DebateWorkflow(
+                config=config,
+                prompt_repository=PromptRepository(config.prompts.directory),
+                model_factory=model_factory,
+            )
+            results = workflow.run_many(topics, max_workers=max(1, args.workers))
+            presenter = ConsolePresenter()
+            for index, result in enumerate(results, start=1):
+                per_debate_file = None
+                if output_file:
+                    per_debate_file = output_file.with_name(f"{output_file.stem}-{index}{output_file.suffix}")
+                presenter.present(result=result, output_file=per_debate_file)
+            return 0
+
         topic = (args.prompt or "").strip()
         if not topic:
-            raise RuntimeError("No debate topic provided. Use -p/--prompt.")
-        observer = ConsoleDebateObserver()
+            raise RuntimeError("No debate topic provided. Use -p/--prompt or --topics-file.")
+        observer: CompositeObserver | ConsoleDebateObserver = ConsoleDebateObserver()
+        file_observer = None
+        if output_file:
+            # Tee turns to the output file as they happen so a long debate
+            # can be followed with tail -f; the final report overwrites it.
+            file_observer = TranscriptFileObserver(output_file)
+            observer = CompositeObserver(observer, file_observer)
         workflow = DebateWorkflow(
             config=config,
             prompt_repository=PromptRepository(config.prompts.directory),
-            model_factory=OllamaChatFactory(config),
+            model_factory=model_factory,
             observer=observer,
         )
-        result = workflow.run(topic=topic)
-        ConsolePresenter().present(result=result, output_file=Path(args.file) if args.file else None, skip_transcript=True)
+        try:
+            result = workflow.run(topic=topic)
+        finally:
+            if file_observer:
+                file_observer.close()
+        ConsolePresenter().present(result=result, output_file=output_file, skip_transcript=True)
         return 0
     except Exception as exc:  # noqa: BLE001 - CLI entry point should surface the real error.
         print(f"Fatal Error: {exc}", file=sys.stderr)
@@ -1,20 +1,38 @@
 from __future__ import annotations
 
 from pathlib import Path
+from typing import Dict
 
-from jinja2 import Environment, FileSystemLoader, StrictUndefined
+from jinja2 import Environment, FileSystemLoader, StrictUndefined, TemplateNotFound
 
 
 class PromptRepository:
+    __slots__ = ("_directory", "_exists_cache", "_environment")
+
     def __init__(self, directory: Path):
         self._directory = directory
+        self._exists_cache: Dict[str, bool] = {}
         self._environment = Environment(
             loader=FileSystemLoader(str(directory)),
             undefined=StrictUndefined,
             autoescape=False,
             trim_blocks=True,
             lstrip_blocks=True,
+            # Templates never change mid-debate: compile each one once and skip
+            # the per-render stat() freshness check.
+            auto_reload=False,
         )
 
+    def exists(self, prompt_file: str) -> bool:
+        cached = self._exists_cache.get(prompt_file)
+        if cached is None:
+            try:
+                self._environment.get_template(prompt_file)
+                cached = True
+            except TemplateNotFound:
+                cached = False
+            self._exists_cache[prompt_file] = cached
+        return cached
+
     def render(self, prompt_file: str, **context: object) -> str:
         return self._environment.get_template(prompt_file).render(**context).strip()
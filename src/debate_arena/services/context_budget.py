@@ -10,6 +10,8 @@ _DEFAULT_CHARS_PER_TOKEN = 4.0
 
 
 class ContextBudgetService:
+    __slots__ = ("_policy", "_chars_per_token")
+
     def __init__(self, policy: ContextPolicyConfig):
         self._policy = policy
         self._chars_per_token: float = _DEFAULT_CHARS_PER_TOKEN
@@ -30,6 +32,16 @@ class ContextBudgetService:
             return measured_tokens >= threshold
         return self._estimate_tokens(prompt_text) >= threshold
 
+    @property
+    def prompt_budget_tokens(self) -> int:
+        return max(1, self._policy.context_window - self._policy.response_buffer_tokens)
+
+    def fits_prompt_budget(self, prompt_text: str) -> bool:
+        return self._estimate_tokens(prompt_text) <= self.prompt_budget_tokens
+
+    def estimate_tokens(self, text: str) -> int:
+        return self._estimate_tokens(text)
+
     def calibrate(self, prompt_chars: int, actual_tokens: int) -> None:
         if actual_tokens > 0 and prompt_chars > 0:
             self._chars_per_token = prompt_chars / actual_tokens
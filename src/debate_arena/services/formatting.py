@@ -1,17 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Mapping, Sequence
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Set
 
 
 def render_transcript(entries: Sequence[Mapping[str, Any]]) -> str:
     if not entries:
         return "[No previous turns]"
-    lines = []
-    for entry in entries:
-        lines.append(
-            f"Round {entry['round_number']} - {entry['speaker']} ({entry['role']}): {entry['content']}".strip()
-        )
-    return "\n\n".join(lines)
+    return "\n\n".join(
+        f"Round {entry['round_number']} - {entry['speaker']} ({entry['role']}): {entry['content']}".strip()
+        for entry in entries
+    )
 
 
 def render_restrictions(restrictions: Sequence[str]) -> str:
@@ -20,19 +18,27 @@ def render_restrictions(restrictions: Sequence[str]) -> str:
     return "\n".join(f"- {restriction}" for restriction in restrictions)
 
 
+_SPEAKER_NAMES = {
+    "debater_a": "Debater A",
+    "debater_b": "Debater B",
+    "referee": "Referee",
+    "compactor": "Compactor",
+}
+
+
 def speaker_name_for_role(role: str) -> str:
-    return {
-        "debater_a": "Debater A",
-        "debater_b": "Debater B",
-        "referee": "Referee",
-        "compactor": "Compactor",
-    }.get(role, role.replace("_", " ").title())
+    name = _SPEAKER_NAMES.get(role)
+    if name is None:
+        return role.replace("_", " ").title()
+    return name
 
 
 def unique_lines(values: Iterable[Any]) -> List[str]:
     ordered: List[str] = []
+    seen: Set[str] = set()
     for value in values:
         normalized = str(value).strip()
-        if normalized and normalized not in ordered:
+        if normalized and normalized not in seen:
+            seen.add(normalized)
             ordered.append(normalized)
     return ordered
@@ -3,30 +3,53 @@ from __future__ import annotations
 import json
 from typing import Any, Dict
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib fallback.
+    orjson = None  # type: ignore[assignment]
+
+
+_DECODER = json.JSONDecoder()
 
-def extract_json_object(content: str) -> Dict[str, Any]:
-    candidate = content.strip()
-    payloads = [candidate]
 
+def extract_json_object(content: str) -> Dict[str, Any]:
+    candidate = _strip_code_fences(content.strip())
     start_index = candidate.find("{")
+
+    if start_index >= 0:
+        # Fast path: referee output is usually pure JSON, which orjson
+        # parses in native code. orjson rejects trailing data, so payloads
+        # with text after the object fall through to raw_decode below.
+        if orjson is not None:
+            try:
+                parsed = orjson.loads(candidate[start_index:])
+                if isinstance(parsed, dict):
+                    return parsed
+            except orjson.JSONDecodeError:
+                pass
+        # Single string-aware pass: raw_decode parses the first balanced
+        # object directly, so braces inside string values cannot mislead it
+        # and no rfind/slice over the whole payload is needed.
+        try:
+            parsed, _ = _DECODER.raw_decode(candidate, start_index)
+            if isinstance(parsed, dict):
+                return parsed
+        except json.JSONDecodeError:
+            pass
+
+    # Repair path for malformed output, e.g. invalid backslash escapes.
+    payloads = [candidate]
     end_index = candidate.rfind("}")
     if start_index >= 0 and end_index > start_index:
         payloads.append(candidate[start_index : end_index + 1])
-
     for payload in payloads:
-        cleaned = _strip_code_fences(payload)
-        try:
-            parsed = json.loads(cleaned)
-        except json.JSONDecodeError:
+        for repaired in (_escape_invalid_backslashes(payload), payload.replace("\\", "\\\\")):
             try:
-                parsed = json.loads(_escape_invalid_backslashes(cleaned))
+                parsed = json.loads(repaired)
             except json.JSONDecodeError:
-                try:
-                    parsed = json.loads(cleaned.replace("\\", "\\\\"))
-                except json.JSONDecodeError:
-                    continue
-        if isinstance(parsed, dict):
-            return parsed
+                continue
+            if isinstance(parsed, dict):
+                return parsed
 
     raise RuntimeError(f"Model did not return valid JSON: {content}")
 
@@ -8,14 +8,19 @@ from rich.markdown import Markdown
 from rich.panel import Panel
 from rich.rule import Rule
 
-from debate_arena.domain.models import DebateResult, TranscriptEntry
+from debate_arena.domain.models import DebateObserver, DebateResult, TranscriptEntry
 
 
 class ConsoleDebateObserver:
     """Prints debate progress to the console in real-time."""
 
+    __slots__ = ("_console", "_render_markdown")
+
     def __init__(self) -> None:
         self._console = Console()
+        # Markdown layout only pays off on a real terminal; piped output
+        # gets the raw text without the parse/render pass per turn.
+        self._render_markdown = self._console.is_terminal
 
     def on_debate_start(self, topic: str) -> None:
         self._console.print()
@@ -25,7 +30,7 @@ class ConsoleDebateObserver:
     def on_turn(self, entry: TranscriptEntry) -> None:
         color = "blue" if entry.role == "debater_a" else "green"
         self._console.print(Rule(f"[bold {color}]{entry.speaker} · Round {entry.round_number}[/bold {color}]", style=color))
-        self._console.print(Markdown(entry.content))
+        self._console.print(Markdown(entry.content) if self._render_markdown else entry.content)
         self._console.print()
 
     def on_review(self, round_number: int, decision: str, reason: str) -> None:
@@ -45,9 +50,79 @@ class ConsoleDebateObserver:
         self._console.print()
 
 
+class TranscriptFileObserver:
+    """Tees turns to a file as they happen.
+
+    The file handle is opened once for the whole debate and kept open,
+    instead of reopening the file per turn; each turn is flushed so the
+    file can be followed live. The presenter's final report overwrites
+    the tee with the complete transcript and verdict.
+    """
+
+    __slots__ = ("_handle",)
+
+    def __init__(self, output_file: Path) -> None:
+        output_file.parent.mkdir(parents=True, exist_ok=True)
+        self._handle = output_file.open("w", encoding="utf-8")
+
+    def on_debate_start(self, topic: str) -> None:
+        self._handle.write(f"Topic: {topic}\n\n")
+        self._handle.flush()
+
+    def on_turn(self, entry: TranscriptEntry) -> None:
+        self._handle.write(f"{entry.speaker} ({entry.role}) [round {entry.round_number}]:\n")
+        self._handle.write(entry.content)
+        self._handle.write("\n\n")
+        self._handle.flush()
+
+    def on_review(self, round_number: int, decision: str, reason: str) -> None:
+        pass
+
+    def on_compaction(self, compactions: int) -> None:
+        pass
+
+    def on_final_verdict_start(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self._handle.close()
+
+
+class CompositeObserver:
+    """Fans debate events out to several observers."""
+
+    __slots__ = ("_observers",)
+
+    def __init__(self, *observers: DebateObserver) -> None:
+        self._observers = observers
+
+    def on_debate_start(self, topic: str) -> None:
+        for observer in self._observers:
+            observer.on_debate_start(topic)
+
+    def on_turn(self, entry: TranscriptEntry) -> None:
+        for observer in self._observers:
+            observer.on_turn(entry)
+
+    def on_review(self, round_number: int, decision: str, reason: str) -> None:
+        for observer in self._observers:
+            observer.on_review(round_number, decision, reason)
+
+    def on_compaction(self, compactions: int) -> None:
+        for observer in self._observers:
+            observer.on_compaction(compactions)
+
+    def on_final_verdict_start(self) -> None:
+        for observer in self._observers:
+            observer.on_final_verdict_start()
+
+
 class ConsolePresenter:
+    __slots__ = ("_console", "_render_markdown")
+
     def __init__(self) -> None:
         self._console = Console()
+        self._render_markdown = self._console.is_terminal
 
     def present(
         self,
@@ -60,7 +135,7 @@ class ConsolePresenter:
             for entry in result.transcript:
                 color = "blue" if entry.role == "debater_a" else "green"
                 self._console.print(f"[bold {color}]{entry.speaker}[/bold {color}]")
-                self._console.print(Markdown(entry.content))
+                self._console.print(Markdown(entry.content) if self._render_markdown else entry.content)
                 self._console.print()
 
         self._console.print(
@@ -81,7 +156,7 @@ class ConsolePresenter:
                 self._console.print(f"- {restriction}")
         if result.compact_summary:
             self._console.print("\n[bold]Compact summary:[/bold]")
-            self._console.print(Markdown(result.compact_summary))
+            self._console.print(Markdown(result.compact_summary) if self._render_markdown else result.compact_summary)
 
         if output_file:
             output_file.parent.mkdir(parents=True, exist_ok=True)
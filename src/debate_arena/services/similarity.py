@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+from typing import List, Set, Tuple
+
+
+def word_ngrams(text: str, size: int = 3) -> Set[Tuple[str, ...]]:
+    words = text.lower().split()
+    if len(words) < size:
+        return {tuple(words)} if words else set()
+    return {tuple(words[index : index + size]) for index in range(len(words) - size + 1)}
+
+
+def ngram_jaccard(first: str, second: str, size: int = 3) -> float:
+    first_grams = word_ngrams(first, size)
+    second_grams = word_ngrams(second, size)
+    if not first_grams or not second_grams:
+        return 0.0
+    overlap = len(first_grams & second_grams)
+    union = len(first_grams | second_grams)
+    return overlap / union if union else 0.0
+
+
+class RepetitionGuard:
+    """Aborts a streamed generation that converges on a previous turn.
+
+    Used as the should_abort callback of a streamed model call: it receives
+    the accumulated text, throttles itself to one check per chunk of new
+    characters, and trips once the text's word n-grams overlap the reference
+    turn beyond the configured threshold. Tripping early saves the remaining
+    decode tokens of a response that would be rejected as repetition anyway.
+    """
+
+    __slots__ = (
+        "_reference_words",
+        "_threshold",
+        "_min_chars",
+        "_check_stride_chars",
+        "_last_checked_length",
+        "tripped",
+    )
+
+    def __init__(
+        self,
+        reference_text: str,
+        threshold: float,
+        min_chars: int = 200,
+        check_stride_chars: int = 120,
+    ):
+        self._reference_words: List[str] = reference_text.lower().split()
+        self._threshold = threshold
+        self._min_chars = min_chars
+        self._check_stride_chars = check_stride_chars
+        self._last_checked_length = 0
+        self.tripped = False
+
+    def __call__(self, accumulated_text: str) -> bool:
+        if self.tripped:
+            return True
+        if len(accumulated_text) < self._min_chars:
+            return False
+        if len(accumulated_text) - self._last_checked_length < self._check_stride_chars:
+            return False
+        self._last_checked_length = len(accumulated_text)
+        # Compare against a reference prefix of matching length so a partial
+        # generation is not penalized for lacking the reference's tail.
+        accumulated_words = accumulated_text.lower().split()
+        reference_prefix = " ".join(self._reference_words[: len(accumulated_words) + 5])
+        similarity = ngram_jaccard(" ".join(accumulated_words), reference_prefix)
+        if similarity >= self._threshold:
+            self.tripped = True
+        return self.tripped